@@ -4,6 +4,7 @@ from .core import (
     MemoryCRUDRouter,
     OrmarCRUDRouter,
     SQLAlchemyCRUDRouter,
+    SyncSQLAlchemyCRUDRouter,
     TortoiseCRUDRouter,
 )
 
@@ -12,6 +13,7 @@ from ._version import __version__  # noqa: F401
 __all__ = [
     "MemoryCRUDRouter",
     "SQLAlchemyCRUDRouter",
+    "SyncSQLAlchemyCRUDRouter",
     "DatabasesCRUDRouter",
     "TortoiseCRUDRouter",
     "OrmarCRUDRouter",
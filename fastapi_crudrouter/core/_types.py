@@ -1,9 +1,15 @@
-from typing import Dict, TypeVar, Optional, Sequence
+from typing import TypeVar, Optional, Sequence
 
 from fastapi.params import Depends
 from pydantic import BaseModel
 
-PAGINATION = Dict[str, Optional[int]]
+
+class Pagination(BaseModel):
+    skip: int = 0
+    limit: Optional[int] = None
+
+
+PAGINATION = Pagination
 PYDANTIC_SCHEMA = BaseModel
 
 T = TypeVar("T", bound=BaseModel)
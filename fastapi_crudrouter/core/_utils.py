@@ -1,15 +1,30 @@
+from functools import lru_cache
 from typing import Optional, Type, Any
 
-from fastapi import Depends, HTTPException
-from pydantic import create_model
+from fastapi import Depends
+from pydantic import Field, create_model
 
 from ._types import T, PAGINATION, PYDANTIC_SCHEMA
 
 
 class AttrDict(dict):  # type: ignore
-    def __init__(self, *args, **kwargs) -> None:  # type: ignore
-        super(AttrDict, self).__init__(*args, **kwargs)
-        self.__dict__ = self
+    __slots__ = ()
+
+    def __getattribute__(self, key: str) -> Any:
+        # Keys take precedence over dict methods, e.g. a record with an "items" column
+        if dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
+
+        return super().__getattribute__(key)
+
+    def __setattr__(self, key: str, value: Any) -> None:
+        self[key] = value
+
+    def __delattr__(self, key: str) -> None:
+        try:
+            del self[key]
+        except KeyError:
+            raise AttributeError(key) from None
 
 
 def get_pk_type(schema: Type[PYDANTIC_SCHEMA], pk_field: str) -> Any:
@@ -20,11 +35,13 @@ def get_pk_type(schema: Type[PYDANTIC_SCHEMA], pk_field: str) -> Any:
         return int
 
 
+@lru_cache(maxsize=None)
 def schema_factory(
     schema_cls: Type[T], pk_field_name: str = "id", name: str = "Create"
 ) -> Type[T]:
     """
-    Creates a CreateSchema which does not contain the primary key field.
+    Creates a CreateSchema which does not contain the primary key field. Results are
+    cached so routers sharing a schema reuse the same generated model.
     """
 
     # In Pydantic v2, use model_fields, and the field name is the key
@@ -39,41 +56,16 @@ def schema_factory(
     return schema
 
 
-def create_query_validation_exception(field: str, msg: str) -> HTTPException:
-    return HTTPException(
-        422,
-        detail={
-            "detail": [
-                {"loc": ["query", field], "msg": msg, "type": "type_error.integer"}
-            ]
-        },
-    )
-
-
 def pagination_factory(max_limit: Optional[int] = None) -> Any:
     """
     Creates the pagination dependency to be used in the router.
     """
 
-    def pagination(skip: int = 0, limit: Optional[int] = max_limit) -> PAGINATION:
-        if skip < 0:
-            raise create_query_validation_exception(
-                field="skip",
-                msg="skip query parameter must be greater or equal to zero",
-            )
-
-        if limit is not None:
-            if limit <= 0:
-                raise create_query_validation_exception(
-                    field="limit", msg="limit query parameter must be greater than zero"
-                )
-
-            elif max_limit and max_limit < limit:
-                raise create_query_validation_exception(
-                    field="limit",
-                    msg=f"limit query parameter must be less than {max_limit}",
-                )
-
-        return {"skip": skip, "limit": limit}
+    pagination: Type[PAGINATION] = create_model(
+        "Pagination",
+        __base__=PAGINATION,
+        skip=(int, Field(0, ge=0)),
+        limit=(Optional[int], Field(max_limit, gt=0, le=max_limit)),
+    )
 
     return Depends(pagination)
@@ -34,9 +34,9 @@ def pydantify_record(
     models: Union[Model, List[Model]]
 ) -> Union[AttrDict, List[AttrDict]]:
     if type(models) is list:
-        return [AttrDict(**dict(model)) for model in models]
+        return [AttrDict(model) for model in models]
     else:
-        return AttrDict(**dict(models))  # type: ignore
+        return AttrDict(models)  # type: ignore
 
 
 class DatabasesCRUDRouter(CRUDGenerator[PYDANTIC_SCHEMA]):
@@ -66,6 +66,8 @@ class DatabasesCRUDRouter(CRUDGenerator[PYDANTIC_SCHEMA]):
         self.db = database
         self._pk = table.primary_key.columns.values()[0].name
         self._pk_col = self.table.c[self._pk]
+        self._select_stmt = self.table.select()
+        self._delete_all_stmt = self.table.delete()
         self._pk_type: type = get_pk_type(schema, self._pk)
 
         super().__init__(
@@ -88,16 +90,16 @@ class DatabasesCRUDRouter(CRUDGenerator[PYDANTIC_SCHEMA]):
         async def route(
             pagination: PAGINATION = self.pagination,
         ) -> List[Model]:
-            skip, limit = pagination.get("skip"), pagination.get("limit")
+            skip, limit = pagination.skip, pagination.limit
 
-            query = self.table.select().limit(limit).offset(skip)
+            query = self._select_stmt.limit(limit).offset(skip)
             return pydantify_record(await self.db.fetch_all(query))  # type: ignore
 
         return route
 
     def _get_one(self, *args: Any, **kwargs: Any) -> CALLABLE:
         async def route(item_id: self._pk_type) -> Model:  # type: ignore
-            query = self.table.select().where(self._pk_col == item_id)
+            query = self._select_stmt.where(self._pk_col == item_id)
             model = await self.db.fetch_one(query)
 
             if model:
@@ -142,10 +144,9 @@ class DatabasesCRUDRouter(CRUDGenerator[PYDANTIC_SCHEMA]):
 
     def _delete_all(self, *args: Any, **kwargs: Any) -> CALLABLE_LIST:
         async def route() -> List[Model]:
-            query = self.table.delete()
-            await self.db.execute(query=query)
+            await self.db.execute(query=self._delete_all_stmt)
 
-            return await self._get_all()(pagination={"skip": 0, "limit": None})
+            return []
 
         return route
 
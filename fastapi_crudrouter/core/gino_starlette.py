@@ -70,7 +70,7 @@ class GinoCRUDRouter(CRUDGenerator[SCHEMA]):
         async def route(
             pagination: PAGINATION = self.pagination,
         ) -> List[Model]:
-            skip, limit = pagination.get("skip"), pagination.get("limit")
+            skip, limit = pagination.skip, pagination.limit
 
             db_models: List[Model] = (
                 await self.db_model.query.limit(limit).offset(skip).gino.all()
@@ -123,7 +123,7 @@ class GinoCRUDRouter(CRUDGenerator[SCHEMA]):
     def _delete_all(self, *args: Any, **kwargs: Any) -> CALLABLE_LIST:
         async def route() -> List[Model]:
             await self.db_model.delete.gino.status()
-            return await self._get_all()(pagination={"skip": 0, "limit": None})
+            return []
 
         return route
 
@@ -1,4 +1,4 @@
-from typing import Any, Callable, List, Type, cast, Optional, Union
+from typing import Any, Callable, List, Type, Optional, Union
 
 from . import CRUDGenerator, NOT_FOUND
 from ._types import DEPENDENCIES, PAGINATION, PYDANTIC_SCHEMA as SCHEMA
@@ -45,8 +45,7 @@ class MemoryCRUDRouter(CRUDGenerator[SCHEMA]):
 
     def _get_all(self, *args: Any, **kwargs: Any) -> CALLABLE_LIST:
         def route(pagination: PAGINATION = self.pagination) -> List[SCHEMA]:
-            skip, limit = pagination.get("skip"), pagination.get("limit")
-            skip = cast(int, skip)
+            skip, limit = pagination.skip, pagination.limit
 
             return (
                 self.models[skip:]
@@ -4,7 +4,6 @@ from typing import (
     List,
     Optional,
     Type,
-    cast,
     Coroutine,
     Union,
 )
@@ -71,8 +70,8 @@ class OrmarCRUDRouter(CRUDGenerator[Model]):
         async def route(
             pagination: PAGINATION = self.pagination,
         ) -> List[Optional[Model]]:
-            skip, limit = pagination.get("skip"), pagination.get("limit")
-            query = self.schema.objects.offset(cast(int, skip))
+            skip, limit = pagination.skip, pagination.limit
+            query = self.schema.objects.offset(skip)
             if limit:
                 query = query.limit(limit)
             return await query.all()  # type: ignore
@@ -123,7 +122,7 @@ class OrmarCRUDRouter(CRUDGenerator[Model]):
     def _delete_all(self, *args: Any, **kwargs: Any) -> CALLABLE_LIST:
         async def route() -> List[Optional[Model]]:
             await self.schema.objects.delete(each=True)
-            return await self._get_all()(pagination={"skip": 0, "limit": None})
+            return []
 
         return route
 
@@ -1,36 +1,140 @@
-from typing import Any, Callable, List, Type, Generator, Optional, Union
-import inspect
+from dataclasses import is_dataclass
+from inspect import isasyncgenfunction, isgeneratorfunction
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Dict,
+    List,
+    Set,
+    Type,
+    Optional,
+    Union,
+    get_args,
+    get_origin,
+)
 
 from fastapi import Depends, HTTPException, Body
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from pydantic import BaseModel
 
 from . import CRUDGenerator, NOT_FOUND, _utils
 from ._types import DEPENDENCIES, PAGINATION, PYDANTIC_SCHEMA as SCHEMA
 
 try:
+    from sqlalchemy import delete, inspect, select
+    from sqlalchemy.pool import QueuePool
     from sqlalchemy.orm import Session
+    from sqlalchemy.ext.asyncio import (
+        AsyncSession,
+        async_sessionmaker,
+        create_async_engine,
+    )
     from sqlalchemy.ext.declarative import DeclarativeMeta as Model
     from sqlalchemy.exc import IntegrityError
 except ImportError:
     Model = None
     Session = None
+    AsyncSession = None
     IntegrityError = None
     sqlalchemy_installed = False
 else:
     sqlalchemy_installed = True
-    Session = Callable[..., Generator[Session, Any, None]]
 
+ASYNC_SESSION = Callable[..., AsyncGenerator["AsyncSession", None]]
 CALLABLE = Callable[..., Model]
 CALLABLE_LIST = Callable[..., List[Model]]
 
 
+def make_async_db_func(
+    url: str,
+    pool_size: Optional[int] = None,
+    max_overflow: Optional[int] = None,
+    pool_pre_ping: bool = True,
+    **kwargs: Any
+) -> ASYNC_SESSION:
+    """
+    Creates a pooled async engine for the given url and returns a database dependency
+    yielding AsyncSessions from it, suitable for passing to the SQLAlchemyCRUDRouter.
+    The engine is available as the dependency's engine attribute, e.g. for creating
+    tables or disposing of it on shutdown. Queue pools default to a pool_size of 20
+    and a max_overflow of 40; additional keyword arguments are passed through to
+    create_async_engine.
+    """
+    assert sqlalchemy_installed, "SQLAlchemy must be installed for make_async_db_func."
+
+    pool_kwargs = {
+        k: v
+        for k, v in (("pool_size", pool_size), ("max_overflow", max_overflow))
+        if v is not None
+    }
+    explicit = bool(pool_kwargs)
+    poolclass = kwargs.get("poolclass")
+    if poolclass is None or issubclass(poolclass, QueuePool):
+        pool_kwargs = {"pool_size": 20, "max_overflow": 40, **pool_kwargs}
+
+    try:
+        engine = create_async_engine(
+            url, pool_pre_ping=pool_pre_ping, **pool_kwargs, **kwargs
+        )
+    except TypeError:
+        # Dialects such as sqlite pick a pool without sizing arguments by default
+        if explicit or poolclass is not None:
+            raise
+        engine = create_async_engine(url, pool_pre_ping=pool_pre_ping, **kwargs)
+
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def get_db() -> AsyncGenerator["AsyncSession", None]:
+        async with session_factory() as session:
+            yield session
+
+    get_db.engine = engine  # type: ignore
+
+    return get_db
+
+
+def _needs_dump(annotation: Any) -> bool:
+    if get_origin(annotation) is None and isinstance(annotation, type):
+        return issubclass(annotation, BaseModel) or is_dataclass(annotation)
+
+    return any(_needs_dump(arg) for arg in get_args(annotation))
+
+
+def _dump_fields(schema: Type[SCHEMA]) -> Set[str]:
+    """
+    Names of the schema fields holding nested models, which must be dumped before
+    being handed to SQLAlchemy.
+    """
+    return {
+        name
+        for name, field in schema.model_fields.items()
+        if _needs_dump(field.annotation)
+    }
+
+
 class SQLAlchemyCRUDRouter(CRUDGenerator[SCHEMA]):
+    __slots__ = (
+        "db_model",
+        "db_func",
+        "core_list",
+        "_pk",
+        "_pk_type",
+        "_pk_col",
+        "_update_cols",
+        "_create_fields",
+        "_create_dump_fields",
+        "_update_dump_fields",
+        "_create_loaded",
+        "_list_stmt",
+        "_delete_all_stmt",
+        "_route_get_one",
+    )
+
     def __init__(
         self,
         schema: Type[SCHEMA],
         db_model: Model,
-        db: "Session",
+        db: ASYNC_SESSION,
         create_schema: Optional[Type[SCHEMA]] = None,
         update_schema: Optional[Type[SCHEMA]] = None,
         prefix: Optional[str] = None,
@@ -42,15 +146,31 @@ class SQLAlchemyCRUDRouter(CRUDGenerator[SCHEMA]):
         update_route: Union[bool, DEPENDENCIES] = True,
         delete_one_route: Union[bool, DEPENDENCIES] = True,
         delete_all_route: Union[bool, DEPENDENCIES] = True,
+        core_list: Optional[bool] = None,
         **kwargs: Any
     ) -> None:
         assert sqlalchemy_installed, "SQLAlchemy must be installed to use the SQLAlchemyCRUDRouter."
+        self._check_db_func(db)
 
         self.db_model = db_model
         self.db_func = db
+        mapper = inspect(db_model)
+        self.core_list = not mapper.relationships if core_list is None else core_list
         self._pk: str = db_model.__table__.primary_key.columns.keys()[0]
         self._pk_type: type = _utils.get_pk_type(schema, self._pk)
 
+        # Statements are built once so that SQLAlchemy's compiled cache is hit
+        # on every request
+        self._pk_col = getattr(db_model, self._pk)
+        self._list_stmt = (
+            select(*(getattr(db_model, a.key) for a in mapper.column_attrs))
+            if self.core_list
+            else select(db_model)
+        ).order_by(self._pk_col)
+        self._delete_all_stmt = delete(db_model)
+        self._create_loaded = not mapper.relationships
+        self._route_get_one = self._make_get_one()
+
         # Pass only the expected arguments to CRUDGenerator
         super().__init__(
             schema=schema,
@@ -68,65 +188,107 @@ class SQLAlchemyCRUDRouter(CRUDGenerator[SCHEMA]):
             **kwargs
         )
 
+        pk_attr = mapper.get_property_by_column(mapper.primary_key[0]).key
+        self._update_cols = tuple(
+            c
+            for c in mapper.column_attrs.keys()
+            if c != pk_attr and c in self.update_schema.model_fields
+        )
+        self._create_fields = tuple(self.create_schema.model_fields)
+        self._create_dump_fields = _dump_fields(self.create_schema)
+        self._update_dump_fields = _dump_fields(self.update_schema)
+
+    def _check_db_func(self, db: Callable[..., Any]) -> None:
+        if isgeneratorfunction(db):
+            raise TypeError(
+                f"{type(self).__name__} requires a database dependency yielding "
+                "AsyncSessions; use SyncSQLAlchemyCRUDRouter for synchronous Sessions."
+            )
+
+    async def _fetch_all(
+        self, db: "AsyncSession", skip: Optional[int], limit: Optional[int]
+    ) -> List[Model]:
+        result = await db.execute(self._list_stmt.offset(skip).limit(limit))
+        if self.core_list:
+            return result.mappings().all()
+        else:
+            return result.scalars().unique().all()
+
+    async def _fetch_one(self, db: "AsyncSession", item_id: Any) -> Model:
+        model = await db.get(self.db_model, item_id)
+
+        if model:
+            return model
+        else:
+            raise NOT_FOUND from None
+
     def _get_all(self, *args: Any, **kwargs: Any) -> CALLABLE_LIST:
         async def route(
-            db: Union[Session, AsyncSession] = Depends(self.db_func),
+            db: AsyncSession = Depends(self.db_func),
             pagination: PAGINATION = self.pagination,
         ) -> List[Model]:
-            skip, limit = pagination.get("skip"), pagination.get("limit")
-
-            if isinstance(db, AsyncSession):
-                result = await db.execute(
-                    select(self.db_model).order_by(getattr(self.db_model, self._pk)).offset(skip).limit(limit)
-                )
-                return result.scalars().all()
-            else:
-                return (
-                    db.query(self.db_model)
-                    .order_by(getattr(self.db_model, self._pk))
-                    .offset(skip)
-                    .limit(limit)
-                    .all()
-                )
+            skip, limit = pagination.skip, pagination.limit
+
+            return await self._fetch_all(db, skip, limit)
 
         return route
 
-    def _get_one(self, *args: Any, **kwargs: Any) -> CALLABLE:
+    def _create_values(self, model: SCHEMA) -> Dict[str, Any]:
+        values = {k: getattr(model, k) for k in self._create_fields}
+        if self._create_dump_fields:
+            values.update(model.model_dump(include=self._create_dump_fields))
+
+        return values
+
+    def _update_values(self, model: SCHEMA) -> Dict[str, Any]:
+        fields_set = model.model_fields_set
+        values = {k: getattr(model, k) for k in self._update_cols if k in fields_set}
+        dump_fields = self._update_dump_fields.intersection(values)
+        if dump_fields:
+            values.update(model.model_dump(include=dump_fields))
+
+        return values
+
+    def _refresh_created(self, session: "Session") -> bool:
+        """
+        Whether a created row must be refreshed after commit. The flush already loads
+        generated keys and, where the dialect supports RETURNING, server defaults, so
+        a refresh is only needed for sessions that expire instances on commit, models
+        with relationships to load, or dialects without RETURNING.
+        """
+        return (
+            session.expire_on_commit
+            or not self._create_loaded
+            or not session.get_bind(mapper=self.db_model).dialect.insert_returning
+        )
+
+    def _make_get_one(self) -> CALLABLE:
+        pk_type, fetch_one = self._pk_type, self._fetch_one
+
         async def route(
-            item_id: self._pk_type, db: Union[Session, AsyncSession] = Depends(self.db_func)
+            item_id: pk_type, db: AsyncSession = Depends(self.db_func)  # type: ignore
         ) -> Model:
-            if isinstance(db, AsyncSession):
-                result = await db.execute(select(self.db_model).where(getattr(self.db_model, self._pk) == item_id))
-                model = result.scalar_one_or_none()
-            else:
-                model = db.query(self.db_model).get(item_id)
-
-            if model:
-                return model
-            else:
-                raise NOT_FOUND from None
+            return await fetch_one(db, item_id)
 
         return route
 
+    def _get_one(self, *args: Any, **kwargs: Any) -> CALLABLE:
+        return self._route_get_one
+
     def _create(self, *args: Any, **kwargs: Any) -> CALLABLE:
         async def route(
-            model: self.create_schema = Body(...), db: Union[Session, AsyncSession] = Depends(self.db_func)
+            model: self.create_schema = Body(...),
+            db: AsyncSession = Depends(self.db_func),
         ) -> Model:
             try:
-                db_model: Model = self.db_model(**model.model_dump())
+                db_model: Model = self.db_model(**self._create_values(model))
                 db.add(db_model)
-                if isinstance(db, AsyncSession):
-                    await db.commit()
+                await db.commit()
+                if self._refresh_created(db.sync_session):
                     await db.refresh(db_model)
-                else:
-                    db.commit()
-                    db.refresh(db_model)
                 return db_model
             except IntegrityError:
-                if isinstance(db, AsyncSession):
-                    await db.rollback()
-                else:
-                    db.rollback()
+                await db.rollback()
                 raise HTTPException(422, "Key already exists") from None
 
         return route
@@ -135,56 +297,149 @@ class SQLAlchemyCRUDRouter(CRUDGenerator[SCHEMA]):
         async def route(
             item_id: self._pk_type,
             model: self.update_schema = Body(...),
-            db: Union[Session, AsyncSession] = Depends(self.db_func),
+            db: AsyncSession = Depends(self.db_func),
         ) -> Model:
-            db_model: Model = await self._get_one()(item_id, db)
+            db_model: Model = await self._fetch_one(db, item_id)
 
-            for key, value in model.model_dump(exclude={self._pk}).items():
-                if hasattr(db_model, key):
-                    setattr(db_model, key, value)
+            for key, value in self._update_values(model).items():
+                setattr(db_model, key, value)
 
             try:
-                if isinstance(db, AsyncSession):
-                    await db.commit()
-                    await db.refresh(db_model)
-                else:
-                    db.commit()
-                    db.refresh(db_model)
+                await db.commit()
+                await db.refresh(db_model)
                 return db_model
             except IntegrityError as e:
-                if isinstance(db, AsyncSession):
-                    await db.rollback()
-                else:
-                    db.rollback()
+                await db.rollback()
                 self._raise(e)
 
         return route
 
     def _delete_all(self, *args: Any, **kwargs: Any) -> CALLABLE_LIST:
-        async def route(db: Union[Session, AsyncSession] = Depends(self.db_func)) -> List[Model]:
-            if isinstance(db, AsyncSession):
-                await db.execute(self.db_model.__table__.delete())
-                await db.commit()
-                return await self._get_all()(db=db, pagination={"skip": 0, "limit": None})
-            else:
-                db.query(self.db_model).delete()
-                db.commit()
-                return self._get_all()(db=db, pagination={"skip": 0, "limit": None})
+        async def route(db: AsyncSession = Depends(self.db_func)) -> List[Model]:
+            await db.execute(self._delete_all_stmt)
+            await db.commit()
+            return []
 
         return route
 
     def _delete_one(self, *args: Any, **kwargs: Any) -> CALLABLE:
         async def route(
-            item_id: self._pk_type, db: Union[Session, AsyncSession] = Depends(self.db_func)
+            item_id: self._pk_type, db: AsyncSession = Depends(self.db_func)
         ) -> Model:
-            db_model: Model = await self._get_one()(item_id, db)
+            db_model: Model = await self._fetch_one(db, item_id)
 
-            if isinstance(db, AsyncSession):
-                await db.delete(db_model)
-                await db.commit()
-            else:
-                db.delete(db_model)
+            await db.delete(db_model)
+            await db.commit()
+
+            return db_model
+
+        return route
+
+
+class SyncSQLAlchemyCRUDRouter(SQLAlchemyCRUDRouter):
+    """
+    Variant of the SQLAlchemyCRUDRouter for synchronous sessions. Its routes are plain
+    functions, so FastAPI runs them in its threadpool rather than blocking the event
+    loop.
+    """
+
+    def _check_db_func(self, db: Callable[..., Any]) -> None:
+        if isasyncgenfunction(db):
+            raise TypeError(
+                f"{type(self).__name__} requires a database dependency yielding "
+                "Sessions; use SQLAlchemyCRUDRouter for AsyncSessions."
+            )
+
+    def _fetch_all(  # type: ignore
+        self, db: "Session", skip: Optional[int], limit: Optional[int]
+    ) -> List[Model]:
+        result = db.execute(self._list_stmt.offset(skip).limit(limit))
+        if self.core_list:
+            return result.mappings().all()
+        else:
+            return result.scalars().unique().all()
+
+    def _fetch_one(self, db: "Session", item_id: Any) -> Model:  # type: ignore
+        model = db.get(self.db_model, item_id)
+
+        if model:
+            return model
+        else:
+            raise NOT_FOUND from None
+
+    def _get_all(self, *args: Any, **kwargs: Any) -> CALLABLE_LIST:
+        def route(
+            db: Session = Depends(self.db_func),
+            pagination: PAGINATION = self.pagination,
+        ) -> List[Model]:
+            skip, limit = pagination.skip, pagination.limit
+
+            return self._fetch_all(db, skip, limit)
+
+        return route
+
+    def _make_get_one(self) -> CALLABLE:
+        pk_type, fetch_one = self._pk_type, self._fetch_one
+
+        def route(
+            item_id: pk_type, db: Session = Depends(self.db_func)  # type: ignore
+        ) -> Model:
+            return fetch_one(db, item_id)
+
+        return route
+
+    def _create(self, *args: Any, **kwargs: Any) -> CALLABLE:
+        def route(
+            model: self.create_schema = Body(...), db: Session = Depends(self.db_func)
+        ) -> Model:
+            try:
+                db_model: Model = self.db_model(**self._create_values(model))
+                db.add(db_model)
+                db.commit()
+                if self._refresh_created(db):
+                    db.refresh(db_model)
+                return db_model
+            except IntegrityError:
+                db.rollback()
+                raise HTTPException(422, "Key already exists") from None
+
+        return route
+
+    def _update(self, *args: Any, **kwargs: Any) -> CALLABLE:
+        def route(
+            item_id: self._pk_type,
+            model: self.update_schema = Body(...),
+            db: Session = Depends(self.db_func),
+        ) -> Model:
+            db_model: Model = self._fetch_one(db, item_id)
+
+            for key, value in self._update_values(model).items():
+                setattr(db_model, key, value)
+
+            try:
                 db.commit()
+                db.refresh(db_model)
+                return db_model
+            except IntegrityError as e:
+                db.rollback()
+                self._raise(e)
+
+        return route
+
+    def _delete_all(self, *args: Any, **kwargs: Any) -> CALLABLE_LIST:
+        def route(db: Session = Depends(self.db_func)) -> List[Model]:
+            db.execute(self._delete_all_stmt)
+            db.commit()
+            return []
+
+        return route
+
+    def _delete_one(self, *args: Any, **kwargs: Any) -> CALLABLE:
+        def route(item_id: self._pk_type, db: Session = Depends(self.db_func)) -> Model:
+            db_model: Model = self._fetch_one(db, item_id)
+
+            db.delete(db_model)
+            db.commit()
 
             return db_model
 
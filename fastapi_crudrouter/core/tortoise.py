@@ -1,4 +1,4 @@
-from typing import Any, Callable, List, Type, cast, Coroutine, Optional, Union
+from typing import Any, Callable, List, Type, Coroutine, Optional, Union
 
 from . import CRUDGenerator, NOT_FOUND
 from ._types import DEPENDENCIES, PAGINATION, PYDANTIC_SCHEMA as SCHEMA
@@ -59,8 +59,8 @@ class TortoiseCRUDRouter(CRUDGenerator[SCHEMA]):
 
     def _get_all(self, *args: Any, **kwargs: Any) -> CALLABLE_LIST:
         async def route(pagination: PAGINATION = self.pagination) -> List[Model]:
-            skip, limit = pagination.get("skip"), pagination.get("limit")
-            query = self.db_model.all().offset(cast(int, skip))
+            skip, limit = pagination.skip, pagination.limit
+            query = self.db_model.all().offset(skip)
             if limit:
                 query = query.limit(limit)
             return await query
@@ -101,7 +101,7 @@ class TortoiseCRUDRouter(CRUDGenerator[SCHEMA]):
     def _delete_all(self, *args: Any, **kwargs: Any) -> CALLABLE_LIST:
         async def route() -> List[Model]:
             await self.db_model.all().delete()
-            return await self._get_all()(pagination={"skip": 0, "limit": None})
+            return []
 
         return route
 
@@ -61,6 +61,7 @@ def string_pk_client(request):
 @pytest.fixture(
     params=[
         sqlalchemy_implementation_integrity_errors,
+        sqlalchemy_async_implementation_integrity_errors,
         ormar_implementation_integrity_errors,
         gino_implementation_integrity_errors,
     ],
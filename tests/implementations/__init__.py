@@ -20,10 +20,13 @@ from .ormar_ import (
 )
 from .sqlalchemy_ import (
     sqlalchemy_implementation,
+    sqlalchemy_async_implementation,
+    sqlalchemy_async_implementation_integrity_errors,
     sqlalchemy_implementation_custom_ids,
     sqlalchemy_implementation_integrity_errors,
     sqlalchemy_implementation_string_pk,
     DSN_LIST,
+    ASYNC_DSN_LIST,
 )
 from .tortoise_ import tortoise_implementation
 
@@ -34,6 +37,9 @@ implementations = [
 ]
 
 implementations.extend([(sqlalchemy_implementation, dsn) for dsn in DSN_LIST])
+implementations.extend(
+    [(sqlalchemy_async_implementation, dsn) for dsn in ASYNC_DSN_LIST]
+)
 implementations.extend([(databases_implementation, dsn) for dsn in DSN_LIST])
 
 
@@ -1,11 +1,12 @@
 from fastapi import FastAPI
 from sqlalchemy import Column, Float, Integer, String
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy_utils import create_database, database_exists, drop_database
 
-from fastapi_crudrouter import SQLAlchemyCRUDRouter
+from fastapi_crudrouter import SQLAlchemyCRUDRouter, SyncSQLAlchemyCRUDRouter
 from tests import (
     Carrot,
     CarrotCreate,
@@ -24,6 +25,10 @@ DSN_LIST = [
     config.POSTGRES_URI,
 ]
 
+ASYNC_DSN_LIST = [
+    "sqlite+aiosqlite:///./test.db",
+]
+
 
 def _setup_base_app(db_uri: str = DSN_LIST[0]):
     if database_exists(db_uri):
@@ -85,6 +90,59 @@ def sqlalchemy_implementation(db_uri: str):
         ),
     ]
 
+    return app, SyncSQLAlchemyCRUDRouter, router_settings
+
+
+def _setup_async_base_app(db_uri: str = ASYNC_DSN_LIST[0]):
+    app, engine, Base, _ = _setup_base_app(DSN_LIST[0])
+
+    async_engine = create_async_engine(db_uri)
+    AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    async def session():
+        async with AsyncSessionLocal() as session:
+            yield session
+
+    return app, engine, Base, session
+
+
+def sqlalchemy_async_implementation(db_uri: str):
+    app, engine, Base, session = _setup_async_base_app(db_uri)
+
+    class PotatoModel(Base):
+        __tablename__ = "potatoes"
+        id = Column(Integer, primary_key=True, index=True)
+        thickness = Column(Float)
+        mass = Column(Float)
+        color = Column(String)
+        type = Column(String)
+
+    class CarrotModel(Base):
+        __tablename__ = "carrots"
+        id = Column(Integer, primary_key=True, index=True)
+        length = Column(Float)
+        color = Column(String)
+
+    Base.metadata.create_all(bind=engine)
+    router_settings = [
+        dict(
+            schema=Potato,
+            db_model=PotatoModel,
+            db=session,
+            prefix="potato",
+            paginate=PAGINATION_SIZE,
+        ),
+        dict(
+            schema=Carrot,
+            db_model=CarrotModel,
+            db=session,
+            create_schema=CarrotCreate,
+            update_schema=CarrotUpdate,
+            prefix="carrot",
+            tags=CUSTOM_TAGS,
+        ),
+    ]
+
     return app, SQLAlchemyCRUDRouter, router_settings
 
 
@@ -102,7 +160,7 @@ def sqlalchemy_implementation_custom_ids():
 
     Base.metadata.create_all(bind=engine)
     app.include_router(
-        SQLAlchemyCRUDRouter(schema=CustomPotato, db_model=PotatoModel, db=session)
+        SyncSQLAlchemyCRUDRouter(schema=CustomPotato, db_model=PotatoModel, db=session)
     )
 
     return app
@@ -118,7 +176,7 @@ def sqlalchemy_implementation_string_pk():
 
     Base.metadata.create_all(bind=engine)
     app.include_router(
-        SQLAlchemyCRUDRouter(
+        SyncSQLAlchemyCRUDRouter(
             schema=PotatoType,
             create_schema=PotatoType,
             db_model=PotatoTypeModel,
@@ -133,6 +191,46 @@ def sqlalchemy_implementation_string_pk():
 def sqlalchemy_implementation_integrity_errors():
     app, engine, Base, session = _setup_base_app()
 
+    class PotatoModel(Base):
+        __tablename__ = "potatoes"
+        id = Column(Integer, primary_key=True, index=True)
+        thickness = Column(Float)
+        mass = Column(Float)
+        color = Column(String, unique=True)
+        type = Column(String)
+
+    class CarrotModel(Base):
+        __tablename__ = "carrots"
+        id = Column(Integer, primary_key=True, index=True)
+        length = Column(Float)
+        color = Column(String)
+
+    Base.metadata.create_all(bind=engine)
+    app.include_router(
+        SyncSQLAlchemyCRUDRouter(
+            schema=Potato,
+            db_model=PotatoModel,
+            db=session,
+            create_schema=Potato,
+            prefix="potatoes",
+        )
+    )
+    app.include_router(
+        SyncSQLAlchemyCRUDRouter(
+            schema=Carrot,
+            db_model=CarrotModel,
+            db=session,
+            update_schema=CarrotUpdate,
+            prefix="carrots",
+        )
+    )
+
+    return app
+
+
+def sqlalchemy_async_implementation_integrity_errors():
+    app, engine, Base, session = _setup_async_base_app()
+
     class PotatoModel(Base):
         __tablename__ = "potatoes"
         id = Column(Integer, primary_key=True, index=True)
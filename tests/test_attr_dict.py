@@ -0,0 +1,31 @@
+import pytest
+
+from fastapi_crudrouter.core._utils import AttrDict
+
+
+def test_attribute_access():
+    record = AttrDict(id=1, color="Brown")
+    assert record.id == 1 and record.color == "Brown"
+
+    record.color = "Red"
+    assert record["color"] == "Red"
+
+    del record.color
+    assert "color" not in record
+
+    with pytest.raises(AttributeError):
+        record.color
+
+
+def test_keys_shadow_dict_methods():
+    record = AttrDict(items=3, keys="potato")
+
+    assert record.items == 3
+    assert record.keys == "potato"
+    assert dict.items(record) == {"items": 3, "keys": "potato"}.items()
+
+
+def test_no_instance_dict():
+    record = AttrDict(id=1)
+
+    assert not hasattr(record, "__dict__")
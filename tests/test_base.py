@@ -9,6 +9,7 @@ from fastapi_crudrouter import (
     MemoryCRUDRouter,
     OrmarCRUDRouter,
     SQLAlchemyCRUDRouter,
+    SyncSQLAlchemyCRUDRouter,
     DatabasesCRUDRouter,
 )
 
@@ -21,6 +22,7 @@ from tests import Potato
     params=[
         GinoCRUDRouter,
         SQLAlchemyCRUDRouter,
+        SyncSQLAlchemyCRUDRouter,
         MemoryCRUDRouter,
         OrmarCRUDRouter,
         GinoCRUDRouter,
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Float, Integer, String
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from fastapi_crudrouter import SQLAlchemyCRUDRouter
+from fastapi_crudrouter.core.sqlalchemy import make_async_db_func
+from tests import Potato, test_router
+
+URL = "/potatoes"
+basic_potato = dict(thickness=0.24, mass=1.2, color="Brown", type="Russet")
+
+Base = declarative_base()
+
+
+class PotatoModel(Base):
+    __tablename__ = "potatoes"
+    id = Column(Integer, primary_key=True, index=True)
+    thickness = Column(Float)
+    mass = Column(Float)
+    color = Column(String)
+    type = Column(String)
+
+
+async def _create_tables(engine):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+
+def test_pool_arguments():
+    get_db = make_async_db_func(
+        "sqlite+aiosqlite:///./test.db", pool_size=3, max_overflow=4
+    )
+    pool = get_db.engine.pool
+
+    assert isinstance(pool, QueuePool)
+    assert pool.size() == 3 and pool._max_overflow == 4
+
+
+def test_default_pool_arguments():
+    pool = make_async_db_func("sqlite+aiosqlite:///./test.db").engine.pool
+
+    assert isinstance(pool, QueuePool)
+    assert pool.size() == 20 and pool._max_overflow == 40
+
+
+def test_static_pool():
+    get_db = make_async_db_func("sqlite+aiosqlite://")
+
+    assert isinstance(get_db.engine.pool, StaticPool)
+
+
+def test_static_pool_class():
+    get_db = make_async_db_func("sqlite+aiosqlite:///./test.db", poolclass=StaticPool)
+
+    assert isinstance(get_db.engine.pool, StaticPool)
+
+
+def test_pool_arguments_without_queue_pool():
+    with pytest.raises(TypeError):
+        make_async_db_func("sqlite+aiosqlite://", pool_size=3)
+
+
+def test_crud_routes():
+    get_db = make_async_db_func("sqlite+aiosqlite://")
+    asyncio.run(_create_tables(get_db.engine))
+
+    app = FastAPI()
+    app.include_router(
+        SQLAlchemyCRUDRouter(schema=Potato, db_model=PotatoModel, db=get_db)
+    )
+    client = TestClient(app)
+
+    test_router.test_post(client, URL, basic_potato)
+    test_router.test_get(client, URL, expected_length=1)
@@ -0,0 +1,89 @@
+from typing import Optional
+
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from sqlalchemy import Column, Float, Integer, String
+
+from fastapi_crudrouter import SyncSQLAlchemyCRUDRouter
+from tests import ORMModel
+from tests.implementations.sqlalchemy_ import _setup_base_app
+
+URL = "/potatoes"
+basic_potato = dict(thickness=0.24, color="Brown")
+
+
+class PotatoCreate(BaseModel):
+    thickness: float
+    color: str
+
+
+class Potato(PotatoCreate, ORMModel):
+    pass
+
+
+class PotatoUpdate(BaseModel):
+    thickness: Optional[float] = None
+    color: Optional[str] = None
+
+
+def create_app(**kwargs):
+    app, engine, Base, session = _setup_base_app()
+
+    class PotatoModel(Base):
+        __tablename__ = "potatoes"
+        id = Column(Integer, primary_key=True, index=True)
+        thickness = Column(Float)
+        color = Column("potato_color", String)
+
+    Base.metadata.create_all(bind=engine)
+    app.include_router(
+        SyncSQLAlchemyCRUDRouter(
+            schema=Potato,
+            create_schema=PotatoCreate,
+            update_schema=PotatoUpdate,
+            db_model=PotatoModel,
+            db=session,
+            prefix=URL,
+            **kwargs
+        )
+    )
+
+    return app
+
+
+@pytest.fixture
+def client():
+    return TestClient(create_app())
+
+
+def test_update_renamed_column(client):
+    potato = client.post(URL, json=basic_potato).json()
+
+    res = client.put(f'{URL}/{potato["id"]}', json=dict(color="Green"))
+    assert res.status_code == 200, res.json()
+    assert res.json()["color"] == "Green"
+
+    res = client.get(f'{URL}/{potato["id"]}')
+    assert res.json()["color"] == "Green"
+
+
+def test_update_leaves_unset_fields(client):
+    potato = client.post(URL, json=basic_potato).json()
+
+    res = client.put(f'{URL}/{potato["id"]}', json=dict(thickness=2.0))
+    assert res.status_code == 200, res.json()
+
+    data = client.get(f'{URL}/{potato["id"]}').json()
+    assert data["thickness"] == 2.0
+    assert data["color"] == basic_potato["color"]
+
+
+@pytest.mark.parametrize("core_list", [True, False])
+def test_get_all_renamed_column(core_list):
+    client = TestClient(create_app(core_list=core_list))
+    client.post(URL, json=basic_potato)
+
+    res = client.get(URL)
+    assert res.status_code == 200, res.json()
+    assert [p["color"] for p in res.json()] == [basic_potato["color"]]
@@ -0,0 +1,105 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Float, ForeignKey, Integer, String
+from sqlalchemy.orm import validates
+
+from fastapi_crudrouter import SQLAlchemyCRUDRouter, SyncSQLAlchemyCRUDRouter
+from fastapi_crudrouter.core.sqlalchemy import make_async_db_func
+from tests import Potato
+from tests.implementations.sqlalchemy_ import (
+    ASYNC_DSN_LIST,
+    _setup_async_base_app,
+    _setup_base_app,
+)
+
+URL = "/potatoes"
+basic_potato = dict(thickness=0.24, mass=1.2, color="Brown", type="Russet")
+
+
+def _setup_pooled_app():
+    app, engine, Base, _ = _setup_base_app()
+
+    return app, engine, Base, make_async_db_func(ASYNC_DSN_LIST[0])
+
+
+@pytest.fixture(
+    params=[
+        (_setup_base_app, SyncSQLAlchemyCRUDRouter),
+        (_setup_async_base_app, SQLAlchemyCRUDRouter),
+        (_setup_pooled_app, SQLAlchemyCRUDRouter),
+    ],
+    ids=["sync", "async", "pooled"],
+)
+def setup(request):
+    return request.param
+
+
+def create_validated_app(setup_app, router):
+    app, engine, Base, session = setup_app()
+
+    class PotatoModel(Base):
+        __tablename__ = "potatoes"
+        id = Column(Integer, primary_key=True, index=True)
+        thickness = Column(Float)
+        mass = Column(Float)
+        color = Column(String)
+        type = Column(String)
+
+        @validates("color")
+        def validate_color(self, key, value):
+            return value.lower()
+
+    Base.metadata.create_all(bind=engine)
+    app.include_router(
+        router(schema=Potato, db_model=PotatoModel, db=session, prefix=URL)
+    )
+
+    return app
+
+
+def create_joined_table_app(setup_app, router):
+    app, engine, Base, session = setup_app()
+
+    class TuberModel(Base):
+        __tablename__ = "tubers"
+        id = Column(Integer, primary_key=True, index=True)
+        color = Column(String)
+        kind = Column(String)
+        __mapper_args__ = {"polymorphic_on": kind, "polymorphic_identity": "tuber"}
+
+    class PotatoModel(TuberModel):
+        __tablename__ = "potatoes"
+        id = Column(Integer, ForeignKey("tubers.id"), primary_key=True)
+        thickness = Column(Float)
+        mass = Column(Float)
+        type = Column(String)
+        __mapper_args__ = {"polymorphic_identity": "potato"}
+
+    Base.metadata.create_all(bind=engine)
+    app.include_router(
+        router(schema=Potato, db_model=PotatoModel, db=session, prefix=URL)
+    )
+
+    return app
+
+
+def test_create_runs_validators(setup):
+    client = TestClient(create_validated_app(*setup))
+
+    res = client.post(URL, json=basic_potato)
+    assert res.status_code == 200, res.json()
+    assert res.json()["color"] == "brown"
+    assert client.get(f'{URL}/{res.json()["id"]}').json()["color"] == "brown"
+
+
+def test_create_joined_table(setup):
+    client = TestClient(create_joined_table_app(*setup))
+
+    res = client.post(URL, json=basic_potato)
+    assert res.status_code == 200, res.json()
+    potato = res.json()
+    assert {k: potato[k] for k in basic_potato} == basic_potato
+
+    res = client.get(f'{URL}/{potato["id"]}')
+    assert res.status_code == 200, res.json()
+    assert res.json() == potato
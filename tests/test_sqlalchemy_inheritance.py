@@ -0,0 +1,116 @@
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from sqlalchemy import Column, Float, ForeignKey, Integer, String
+
+from fastapi_crudrouter import SyncSQLAlchemyCRUDRouter
+from tests import ORMModel
+from tests.implementations.sqlalchemy_ import _setup_base_app
+
+
+class TuberCreate(BaseModel):
+    color: str
+
+
+class Tuber(TuberCreate, ORMModel):
+    pass
+
+
+class PotatoCreate(TuberCreate):
+    thickness: float
+
+
+class Potato(PotatoCreate, ORMModel):
+    pass
+
+
+def _tuber_model(Base):
+    class TuberModel(Base):
+        __tablename__ = "tubers"
+        id = Column(Integer, primary_key=True, index=True)
+        color = Column(String)
+        kind = Column(String)
+        __mapper_args__ = {"polymorphic_on": kind, "polymorphic_identity": "tuber"}
+
+    return TuberModel
+
+
+def create_single_table_app():
+    app, engine, Base, session = _setup_base_app()
+    TuberModel = _tuber_model(Base)
+
+    class PotatoModel(TuberModel):
+        __mapper_args__ = {"polymorphic_identity": "potato"}
+
+    class YamModel(TuberModel):
+        __mapper_args__ = {"polymorphic_identity": "yam"}
+
+    Base.metadata.create_all(bind=engine)
+    for model, prefix in ((PotatoModel, "potatoes"), (YamModel, "yams")):
+        app.include_router(
+            SyncSQLAlchemyCRUDRouter(
+                schema=Tuber,
+                create_schema=TuberCreate,
+                db_model=model,
+                db=session,
+                prefix=prefix,
+            )
+        )
+
+    return app
+
+
+def create_joined_table_app():
+    app, engine, Base, session = _setup_base_app()
+    TuberModel = _tuber_model(Base)
+
+    class PotatoModel(TuberModel):
+        __tablename__ = "potatoes"
+        id = Column(Integer, ForeignKey("tubers.id"), primary_key=True)
+        thickness = Column(Float)
+        __mapper_args__ = {"polymorphic_identity": "potato"}
+
+    Base.metadata.create_all(bind=engine)
+    app.include_router(
+        SyncSQLAlchemyCRUDRouter(
+            schema=Potato,
+            create_schema=PotatoCreate,
+            db_model=PotatoModel,
+            db=session,
+            prefix="potatoes",
+        )
+    )
+
+    return app
+
+
+def test_get_all_single_table():
+    client = TestClient(create_single_table_app())
+    client.post("/potatoes", json=dict(color="Brown"))
+    client.post("/yams", json=dict(color="Orange"))
+
+    res = client.get("/potatoes")
+    assert res.status_code == 200, res.json()
+    assert [p["color"] for p in res.json()] == ["Brown"]
+
+
+def test_get_all_joined_table():
+    client = TestClient(create_joined_table_app())
+    potatoes = [dict(color="Brown", thickness=0.2), dict(color="Red", thickness=0.4)]
+    for potato in potatoes:
+        res = client.post("/potatoes", json=potato)
+        assert res.status_code == 200, res.json()
+
+    res = client.get("/potatoes")
+    assert res.status_code == 200, res.json()
+    assert [{k: p[k] for k in ("color", "thickness")} for p in res.json()] == potatoes
+
+
+def test_delete_all_single_table():
+    client = TestClient(create_single_table_app())
+    client.post("/potatoes", json=dict(color="Brown"))
+    client.post("/yams", json=dict(color="Orange"))
+
+    res = client.delete("/potatoes")
+    assert res.status_code == 200, res.json()
+    assert client.get("/potatoes").json() == []
+    assert [y["color"] for y in client.get("/yams").json()] == ["Orange"]
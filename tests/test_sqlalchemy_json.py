@@ -0,0 +1,61 @@
+from typing import Optional
+
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from sqlalchemy import JSON, Column, Integer
+
+from fastapi_crudrouter import SyncSQLAlchemyCRUDRouter
+from tests import ORMModel
+from tests.implementations.sqlalchemy_ import _setup_base_app
+
+URL = "/potatoes"
+
+
+class Origin(BaseModel):
+    country: str
+    farm: Optional[str] = None
+
+
+class PotatoCreate(BaseModel):
+    origin: Optional[Origin] = None
+
+
+class Potato(PotatoCreate, ORMModel):
+    pass
+
+
+def create_app():
+    app, engine, Base, session = _setup_base_app()
+
+    class PotatoModel(Base):
+        __tablename__ = "potatoes"
+        id = Column(Integer, primary_key=True, index=True)
+        origin = Column(JSON)
+
+    Base.metadata.create_all(bind=engine)
+    app.include_router(
+        SyncSQLAlchemyCRUDRouter(
+            schema=Potato,
+            create_schema=PotatoCreate,
+            db_model=PotatoModel,
+            db=session,
+            prefix=URL,
+        )
+    )
+
+    return app
+
+
+def test_nested_model_column():
+    client = TestClient(create_app())
+    origin = dict(country="Peru", farm="Andes")
+
+    res = client.post(URL, json=dict(origin=origin))
+    assert res.status_code == 200, res.json()
+    potato = res.json()
+    assert potato["origin"] == origin
+
+    origin["country"] = "Chile"
+    res = client.put(f'{URL}/{potato["id"]}', json=dict(origin=origin))
+    assert res.status_code == 200, res.json()
+    assert client.get(f'{URL}/{potato["id"]}').json()["origin"] == origin
@@ -5,7 +5,7 @@ from pydantic import BaseModel
 from sqlalchemy import Column, ForeignKey, Integer
 from sqlalchemy.orm import relationship
 
-from fastapi_crudrouter import SQLAlchemyCRUDRouter
+from fastapi_crudrouter import SyncSQLAlchemyCRUDRouter
 from tests import ORMModel, test_router
 from tests.implementations.sqlalchemy_ import _setup_base_app
 
@@ -40,14 +40,14 @@ def create_app():
         children = relationship(Child, backref="parent", lazy="joined")
 
     Base.metadata.create_all(bind=engine)
-    parent_router = SQLAlchemyCRUDRouter(
+    parent_router = SyncSQLAlchemyCRUDRouter(
         schema=ParentSchema,
         create_schema=ParentCreate,
         db_model=Parent,
         db=session,
         prefix=PARENT_URL,
     )
-    child_router = SQLAlchemyCRUDRouter(
+    child_router = SyncSQLAlchemyCRUDRouter(
         schema=ChildSchema, db_model=Child, db=session, prefix=CHILD_URL
     )
     app.include_router(parent_router)
@@ -67,3 +67,16 @@ def test_nested_models():
 
     data = res.json()
     assert type(data["children"]) is list and data["children"], data
+
+
+def test_nested_models_list():
+    client = TestClient(create_app())
+
+    parent = test_router.test_post(client, PARENT_URL, dict())
+    test_router.test_post(client, CHILD_URL, dict(id=0, parent_id=parent["id"]))
+
+    res = client.get(PARENT_URL)
+    assert res.status_code == 200, res.json()
+
+    data = res.json()
+    assert len(data) == 1 and data[0]["children"], data
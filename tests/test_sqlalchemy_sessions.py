@@ -0,0 +1,30 @@
+import pytest
+from sqlalchemy import Column, Integer
+
+from fastapi_crudrouter import SQLAlchemyCRUDRouter, SyncSQLAlchemyCRUDRouter
+from tests import Potato
+from tests.implementations.sqlalchemy_ import _setup_async_base_app, _setup_base_app
+
+
+def _potato_model(Base):
+    class PotatoModel(Base):
+        __tablename__ = "potatoes"
+        id = Column(Integer, primary_key=True, index=True)
+
+    return PotatoModel
+
+
+def test_async_router_rejects_sync_sessions():
+    _, _, Base, session = _setup_base_app()
+
+    with pytest.raises(TypeError, match="SyncSQLAlchemyCRUDRouter"):
+        SQLAlchemyCRUDRouter(schema=Potato, db_model=_potato_model(Base), db=session)
+
+
+def test_sync_router_rejects_async_sessions():
+    _, _, Base, session = _setup_async_base_app()
+
+    with pytest.raises(TypeError, match="SQLAlchemyCRUDRouter"):
+        SyncSQLAlchemyCRUDRouter(
+            schema=Potato, db_model=_potato_model(Base), db=session
+        )